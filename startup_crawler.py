@@ -3,23 +3,34 @@
 import scrapy
 from scrapy.crawler import CrawlerProcess
 from scrapy.loader import ItemLoader
-from itemloaders.processors import TakeFirst, Join, MapCompose
+from itemloaders.processors import TakeFirst, Join, MapCompose, Identity
 from scrapy.exporters import CsvItemExporter
 from scrapy import signals
 from scrapy.http import FormRequest
 from scrapy.utils.project import get_project_settings
-from scrapy.exceptions import CloseSpider
+from scrapy.exceptions import CloseSpider, IgnoreRequest, NotConfigured
+from scrapy.spidermiddlewares.httperror import HttpError
 from scrapy.dupefilters import RFPDupeFilter
+from twisted.internet.threads import deferToThread
+from twisted.internet.defer import CancelledError
+from parsel.csstranslator import css2xpath
+from lxml import etree
 from urllib.parse import urljoin, urlparse
+import io
 import os
 import re
+import tempfile
+from collections import deque
 import json
 import logging
 from datetime import datetime
+from functools import partial
 import time
-import hashlib
 from pathlib import Path
 from w3lib.html import remove_tags
+from pybloom_live import ScalableBloomFilter
+import ahocorasick
+import xxhash
 
 # Set up logging with proper configuration
 logging.basicConfig(
@@ -31,6 +42,120 @@ logging.basicConfig(
     ]
 )
 
+# Compile regular expressions once at import time
+EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+PHONE_PATTERNS = [
+    re.compile(r'\+39\s?\d{10}'),
+    re.compile(r'\+39\s?\d{3}[-\s]?\d{7}'),
+    re.compile(r'\+39\s?\d{2}[-\s]?\d{8}'),
+    re.compile(r'\+39\s?\d{3}[-\s]?\d{3}[-\s]?\d{4}'),
+    re.compile(r'\+39\s?\d{3}[-\s]?\d{4}[-\s]?\d{3}'),
+    re.compile(r'0\d{1,3}[-\s]?\d{6,7}'),
+    re.compile(r'3\d{2}[-\s]?\d{6,7}')
+]
+# Fallback scan for date, email and phone in a single pass over the page.
+# Group names match the item fields. The date branch is a lookahead so the
+# keyword-to-date span it covers doesn't hide emails or phones inside it.
+# Everything it matches is ASCII, so it is compiled as a bytes pattern and
+# run over the raw body.
+FIELDS_PATTERN = re.compile((
+    f'(?P<email>{EMAIL_PATTERN.pattern})'
+    f'|(?=(?:costituzione|costituita|foundation|created).*?'
+    r'(?P<creation_date>\d{2}[/.-]\d{2}[/.-]\d{4}|\d{4}[/.-]\d{2}[/.-]\d{2}))'
+    f'|(?P<phone>{"|".join(p.pattern for p in PHONE_PATTERNS)})'
+).encode(), re.I)
+# Free or placeholder mail domains, used only if no company address turns up
+FREE_EMAIL_PATTERN = re.compile(r'example\.com|gmail\.com|libero\.it|hotmail', re.I)
+COMPANY_HREF_RE = re.compile(r'/(company|startup|detail|scheda|impresa)/', re.I)
+# Page normalization for content digests: drop markup, collapse whitespace and digits
+# (bytes patterns: the digest is taken from the raw body, before any decoding)
+TAG_PATTERN = re.compile(rb'<[^>]+>')
+WS_DIGITS_PATTERN = re.compile(rb'\s+|\d+')
+# Shape checks for values read after a label; a value that fails is left
+# to the XPath label strategies
+DATE_VALUE_PATTERN = re.compile(r'\d{1,4}[/.-]\d{1,2}[/.-]\d{2,4}')
+PHONE_VALUE_PATTERN = re.compile(r'(?:\d[\s./-]?){6,}')
+PLACE_VALUE_PATTERN = re.compile(r'[^\d@:]{2,60}')
+# Item loader cleanup: collapse whitespace, keep only date or phone characters
+WHITESPACE_PATTERN = re.compile(r'\s+')
+NON_DATE_CHARS_PATTERN = re.compile(r'[^\d/.-]')
+NON_PHONE_CHARS_PATTERN = re.compile(r'[^\d+\s-]')
+
+
+def build_label_automaton(field_labels):
+    """Build an Aho-Corasick automaton over all field labels, tagged with their field key"""
+    automaton = ahocorasick.Automaton()
+    for key, labels in field_labels.items():
+        for label in labels:
+            automaton.add_word(label, (key, label))
+    automaton.make_automaton()
+    return automaton
+
+# Text the label scan reads: non-blank body text outside scripts, styles and
+# page chrome. Text inside links is read as a value but never as a label
+LABEL_SCAN_TEXT_XPATH = etree.XPath(
+    '//body//text()[normalize-space()]'
+    '[not(ancestor::script or ancestor::style or ancestor::nav or ancestor::header or ancestor::footer)]'
+)
+IN_LINK_XPATH = etree.XPath('boolean(ancestor-or-self::a)')
+
+
+def text_owner(node):
+    """Element a text node from an XPath result belongs to (a tail belongs to its parent's parent)"""
+    parent = node.getparent()
+    return parent.getparent() if node.is_tail and parent is not None else parent
+
+
+# Follow-up queries run on each label hit, compiled once
+OWN_TEXT_XPATH = etree.XPath('text()')
+STRING_VALUE_XPATH = etree.XPath('string(.)')
+NEXT_SIBLING_TEXT_XPATH = etree.XPath('following-sibling::*[1]//text()')
+NEXT_CELL_TEXT_XPATH = etree.XPath('following-sibling::td[1]//text()')
+NEXT_DD_TEXT_XPATH = etree.XPath('following-sibling::dd[1]//text()')
+
+
+def write_file(filename, data):
+    """Write data via a temp file and rename, so a dump is never left half-written"""
+    directory = os.path.dirname(filename) or '.'
+    with tempfile.NamedTemporaryFile(dir=directory, delete=False) as f:
+        f.write(data)
+    os.replace(f.name, filename)
+    logging.info(f"Saved {filename}")
+
+def write_file_in_thread(filename, data):
+    """Write a debug file from the reactor thread pool instead of blocking the crawl"""
+    deferred = deferToThread(write_file, filename, data)
+    deferred.addErrback(lambda failure: logging.error(f"Could not save {filename}: {failure.value}"))
+    return deferred
+
+def as_flag(value):
+    """Read a bool, or a string from the environment or a -a spider argument, as an on/off flag"""
+    if isinstance(value, str):
+        return value.strip().lower() in ('1', 'true', 'yes', 'on')
+    return bool(value)
+
+
+def first(values, default=None):
+    """First item of an lxml XPath result list, like parsel's .get()"""
+    return values[0] if values else default
+
+def url_joiner(base_url):
+    """Return a urljoin bound to one page that skips URL parsing for the common link shapes"""
+    parsed = urlparse(base_url)
+    origin = f'{parsed.scheme}://{parsed.netloc}'
+    
+    def join(href):
+        if href.startswith(('http://', 'https://')):
+            return href
+        if href.startswith('//'):
+            return f'{parsed.scheme}:{href}'
+        # Root-relative paths with dot segments still need urljoin to resolve them
+        if href.startswith('/') and '/.' not in href:
+            return origin + href
+        return urljoin(base_url, href)
+    
+    return join
+
 class StartupItem(scrapy.Item):
     """Define the item structure for storing startup data with cleaner field definitions"""
     company_name = scrapy.Field()
@@ -48,15 +173,16 @@ class StartupLoader(ItemLoader):
     """Custom item loader with processors for clean data extraction"""
     default_output_processor = TakeFirst()
     description_out = Join(' ')
+    file_urls_out = Identity()  # FilesPipeline expects the full list
     
     # Clean text by removing excessive whitespace
-    company_name_in = MapCompose(str.strip, lambda x: re.sub(r'\s+', ' ', x))
-    description_in = MapCompose(str.strip, lambda x: re.sub(r'\s+', ' ', x))
+    company_name_in = MapCompose(str.strip, partial(WHITESPACE_PATTERN.sub, ' '))
+    description_in = MapCompose(str.strip, partial(WHITESPACE_PATTERN.sub, ' '))
     
     # Clean date formats
     creation_date_in = MapCompose(
         str.strip,
-        lambda x: re.sub(r'[^\d/.-]', '', x)
+        partial(NON_DATE_CHARS_PATTERN.sub, '')
     )
     
     # Clean email addresses
@@ -69,7 +195,7 @@ class StartupLoader(ItemLoader):
     # Clean phone numbers
     phone_in = MapCompose(
         str.strip,
-        lambda x: re.sub(r'[^\d+\s-]', '', x)
+        partial(NON_PHONE_CHARS_PATTERN.sub, '')
     )
 
 
@@ -78,8 +204,10 @@ class CacheURLFilter(RFPDupeFilter):
     
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.seen_urls = set()
-        self.company_fingerprints = set()
+        # Bloom filter keeps memory bounded on long crawls; a false positive
+        # silently drops a page, so keep the rate low (~1e-5)
+        self.seen_urls = ScalableBloomFilter(initial_capacity=100000, error_rate=1e-5)
+        self.company_fingerprints = ScalableBloomFilter(initial_capacity=100000, error_rate=1e-5)
     
     def request_seen(self, request):
         # Get URL without query parameters for better deduplication
@@ -91,17 +219,24 @@ class CacheURLFilter(RFPDupeFilter):
             return True
         
         # For company pages, also check content fingerprints
-        if any(marker in request.url for marker in ['/company/', '/startup/', '/detail/', '/scheda/', '/impresa/']):
+        if COMPANY_HREF_RE.search(request.url):
             if 'company_fingerprint' in request.meta and request.meta['company_fingerprint'] in self.company_fingerprints:
                 return True
             
         # Mark URL as seen
         self.seen_urls.add(base_url)
-        return super().request_seen(request)
+        # The exact fingerprint set is only needed to persist and resume a JOBDIR run
+        if self.file:
+            return super().request_seen(request)
+        return False
     
     def register_company_fingerprint(self, fingerprint):
         """Register a company content fingerprint to avoid duplicates"""
         self.company_fingerprints.add(fingerprint)
+    
+    def has_company_fingerprint(self, fingerprint):
+        """Check whether a page with this content fingerprint was already parsed"""
+        return fingerprint in self.company_fingerprints
 
 
 class StartupRegistrySpider(scrapy.Spider):
@@ -109,22 +244,6 @@ class StartupRegistrySpider(scrapy.Spider):
     allowed_domains = ['startup.registroimprese.it']
     start_urls = ['https://startup.registroimprese.it/isin/home']
     
-    # Compile regular expressions once for efficiency
-    EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
-    PHONE_PATTERNS = [
-        re.compile(r'\+39\s?\d{10}'),
-        re.compile(r'\+39\s?\d{3}[-\s]?\d{7}'),
-        re.compile(r'\+39\s?\d{2}[-\s]?\d{8}'),
-        re.compile(r'\+39\s?\d{3}[-\s]?\d{3}[-\s]?\d{4}'),
-        re.compile(r'\+39\s?\d{3}[-\s]?\d{4}[-\s]?\d{3}'),
-        re.compile(r'0\d{1,3}[-\s]?\d{6,7}'),
-        re.compile(r'3\d{2}[-\s]?\d{6,7}')
-    ]
-    DATE_PATTERNS = [
-        re.compile(r'(?:costituzione|costituita|foundation|created).*?(\d{2}[/.-]\d{2}[/.-]\d{4})'),
-        re.compile(r'(?:costituzione|costituita|foundation|created).*?(\d{4}[/.-]\d{2}[/.-]\d{2})')
-    ]
-    
     # Define robust selectors based on priority
     COMPANY_NAME_SELECTORS = [
         'h1', 'h2', '.company-name', '#company-name',
@@ -139,6 +258,44 @@ class StartupRegistrySpider(scrapy.Spider):
         'main p', 'article p', '.content p', '#content p'
     ]
     
+    # Text XPaths for the selectors above, translated from CSS once
+    COMPANY_NAME_XPATHS = [css2xpath(f'{selector}::text') for selector in COMPANY_NAME_SELECTORS]
+    DESCRIPTION_XPATHS = [css2xpath(f'{selector}::text') for selector in DESCRIPTION_SELECTORS]
+    
+    # Search result links, queried as a single selector translated once
+    COMPANY_LINK_SELECTORS = [
+        'a[href*="/company/"]',
+        'a[href*="/startup/"]', 
+        'a[href*="/detail/"]', 
+        'a[href*="/scheda/"]',
+        'a[href*="/impresa/"]',
+        'a[href*="?id="]'
+    ]
+    COMPANY_LINKS_XPATH = css2xpath(', '.join(f'{selector}::attr(href)' for selector in COMPANY_LINK_SELECTORS))
+    # Any table row link; 'table' already covers the specific results/companies/data tables
+    TABLE_LINKS_XPATH = css2xpath('table tr a::attr(href)')
+    
+    # Pagination: every way of marking a "next" link, OR'd into one XPath
+    NEXT_PAGE_XPATH = (
+        '//a[@href != "" and ('
+        'contains(., "Next") or contains(., "Successivo") or contains(., "Avanti") or contains(., "»")'
+        ' or contains(concat(" ", normalize-space(@class), " "), " next ")'
+        ' or ancestor::li[contains(concat(" ", normalize-space(@class), " "), " next ")]'
+        ' or @rel="next" or @aria-label="Next" or @aria-label="Successivo"'
+        ')]/@href'
+    )
+    ACTIVE_PAGE_SELECTORS = ['li.active', 'li.selected', 'a.active', 'a.selected', '.pagination .current']
+    ACTIVE_PAGE_XPATHS = [css2xpath(f'{selector}::text') for selector in ACTIVE_PAGE_SELECTORS]
+    
+    # Downloadable files: links by extension or download-related links,
+    # unioned into one selector
+    FILE_EXTENSIONS = ['.pdf', '.doc', '.docx', '.xls', '.xlsx']
+    DOWNLOAD_INDICATORS = ['download', 'allegato', 'attachment', 'file', 'documento']
+    FILE_LINKS_XPATH = css2xpath(', '.join(
+        [f'a[href$="{ext}"]::attr(href)' for ext in FILE_EXTENSIONS]
+        + [f'a[href*="{indicator}"]::attr(href)' for indicator in DOWNLOAD_INDICATORS]
+    ))
+    
     # Labels for various fields (internationalized)
     FIELD_LABELS = {
         'date': ['Data Costituzione', 'Data di costituzione', 'Costituzione', 
@@ -148,11 +305,60 @@ class StartupRegistrySpider(scrapy.Spider):
         'phone': ['Telefono', 'Tel', 'Phone', 'Contatto', 'Contact']
     }
     
+    # One compiled XPath per field matching any of its labels: elements whose
+    # own text contains a label, and <dt> elements containing one anywhere
+    FIELD_LABEL_XPATHS = {
+        key: (
+            etree.XPath('//*[' + ' or '.join(f'contains(text(), "{label}")' for label in labels) + ']'),
+            etree.XPath('//dt[' + ' or '.join(f'contains(., "{label}")' for label in labels) + ']'),
+        )
+        for key, labels in FIELD_LABELS.items()
+    }
+    
+    # Largest company page body worth downloading (bytes)
+    COMPANY_PAGE_MAXSIZE = 2 * 1024 * 1024
+    
+    # Number of rotating file slots for error page dumps
+    ERROR_DUMP_SLOTS = 32
+    
+    # Scans page text for every label at once
+    LABEL_AUTOMATON = build_label_automaton(FIELD_LABELS)
+    
+    # Every label, so a label scan never takes another label as a value
+    ALL_LABELS = frozenset(label for labels in FIELD_LABELS.values() for label in labels)
+    
+    # Checks a value read by the label scan must pass for each FIELD_LABELS key
+    LABEL_VALUE_CHECKS = {
+        'date': DATE_VALUE_PATTERN.search,
+        'region': PLACE_VALUE_PATTERN.fullmatch,
+        'city': PLACE_VALUE_PATTERN.fullmatch,
+        'phone': PHONE_VALUE_PATTERN.search,
+    }
+    
+    # Item field filled from each FIELD_LABELS key
+    LABELED_FIELDS = (
+        ('creation_date', 'date'),
+        ('region', 'region'),
+        ('city', 'city'),
+        ('phone', 'phone'),
+    )
+    
     # Better custom settings with explanations
     custom_settings = {
-        'DOWNLOAD_DELAY': 2,  # Respectful crawling delay
-        'CONCURRENT_REQUESTS': 2,  # Limited concurrency for stability
-        'RANDOMIZE_DOWNLOAD_DELAY': True,
+        # Network-bound crawl: keep many requests in flight and let the
+        # scheduler prefer the least busy download slots
+        'CONCURRENT_REQUESTS': 32,
+        'CONCURRENT_REQUESTS_PER_DOMAIN': 16,
+        'SCHEDULER_PRIORITY_QUEUE': 'scrapy.pqueues.DownloaderAwarePriorityQueue',
+        'REACTOR_THREADPOOL_MAXSIZE': 20,
+        # asyncio event loop under Twisted, so async def callbacks and
+        # asyncio libraries can run without blocking the crawl
+        'TWISTED_REACTOR': 'twisted.internet.asyncioreactor.AsyncioSelectorReactor',
+        # Resolve through the reactor and cache lookups across requests
+        'DNS_RESOLVER': 'scrapy.resolver.CachingHostnameResolver',
+        'DNSCACHE_ENABLED': True,
+        'DNSCACHE_SIZE': 10000,
+        'DNS_TIMEOUT': 30,
         'USER_AGENT': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36',
         'HTTPERROR_ALLOW_ALL': True,
         'COOKIES_ENABLED': True,
@@ -161,6 +367,7 @@ class StartupRegistrySpider(scrapy.Spider):
         'ITEM_PIPELINES': {
             'scrapy.pipelines.files.FilesPipeline': 1,
             '__main__.StartupExportPipeline': 300,
+            '__main__.StartupParquetPipeline': 400,
         },
         'FILES_STORE': 'downloads',
         'DOWNLOADER_MIDDLEWARES': {
@@ -168,22 +375,37 @@ class StartupRegistrySpider(scrapy.Spider):
         },
         'DUPEFILTER_CLASS': '__main__.CacheURLFilter',
         'LOG_LEVEL': 'INFO',
-        # Enable autothrottle for adaptive crawling speed
+        # AutoThrottle owns the request delay: it follows measured latency
+        # instead of a fixed DOWNLOAD_DELAY
         'AUTOTHROTTLE_ENABLED': True,
-        'AUTOTHROTTLE_START_DELAY': 5,
-        'AUTOTHROTTLE_MAX_DELAY': 60,
-        'AUTOTHROTTLE_TARGET_CONCURRENCY': 1.0,
+        'AUTOTHROTTLE_START_DELAY': 1.0,
+        'AUTOTHROTTLE_MAX_DELAY': 30.0,
+        'AUTOTHROTTLE_TARGET_CONCURRENCY': 4.0,
+        'AUTOTHROTTLE_DEBUG': False,
+        # Keep fetched pages on disk so reruns only hit the network for
+        # new or expired pages
+        'HTTPCACHE_ENABLED': True,
+        'HTTPCACHE_EXPIRATION_SECS': 7 * 24 * 3600,
+        'HTTPCACHE_DIR': 'httpcache',
+        'HTTPCACHE_STORAGE': 'scrapy.extensions.httpcache.FilesystemCacheStorage',
+        'HTTPCACHE_POLICY': 'scrapy.extensions.httpcache.RFC2616Policy',
+        'HTTPCACHE_IGNORE_HTTP_CODES': [500, 502, 503, 504, 408],
     }
     
     def __init__(self, debug=False, *args, **kwargs):
         super(StartupRegistrySpider, self).__init__(*args, **kwargs)
-        self.debug = debug
+        # HTML dumps are off unless explicitly requested
+        self.debug = as_flag(debug) or as_flag(os.environ.get('STARTUP_CRAWLER_DEBUG', ''))
         self.company_count = 0
         
+        # Recently dumped (status, body digest) pairs and rotating slot counter
+        self.error_ring = deque(maxlen=self.ERROR_DUMP_SLOTS)
+        self.error_dump_count = 0
+        
         # Create directories only once
         os.makedirs('downloads', exist_ok=True)
         
-        if debug:
+        if self.debug:
             # Only create debug directory if debug mode is enabled
             os.makedirs('debug', exist_ok=True)
     
@@ -216,60 +438,28 @@ class StartupRegistrySpider(scrapy.Spider):
         if self.debug:
             self.save_response(response, 'homepage')
         
-        # Look for the main search form
-        search_form = None
-        
-        # First try to find an advanced search form
-        for form in response.css('form'):
-            action = form.css('::attr(action)').get() or ''
-            if 'search' in action or 'ricerca' in action:
-                search_form = form
-                break
-        
-        # If no specific search form found, take the first form
-        if not search_form and response.css('form'):
-            search_form = response.css('form')[0]
-        
-        # If we found a form, submit it
-        if search_form:
-            action = search_form.css('::attr(action)').get()
-            method = search_form.css('::attr(method)').get() or 'GET'
-            
-            # Extract form data intelligently
-            formdata = {}
-            for input_elem in search_form.css('input, select'):
-                name = input_elem.css('::attr(name)').get()
-                if name:
-                    value = input_elem.css('::attr(value)').get() or ''
-                    formdata[name] = value
-            
-            # Add search parameters
-            formdata.update({
-                'searchType': 'advanced',
-                'stato': 'A',  # Active companies
-            })
-            
-            # Build form action URL
-            action_url = urljoin(response.url, action) if action else 'https://startup.registroimprese.it/isin/search'
-            
-            logging.info(f"Submitting form to {action_url}")
-            
-            # Submit the form with proper method
-            if method.upper() == 'POST':
-                yield FormRequest(
-                    url=action_url,
-                    formdata=formdata,
-                    callback=self.parse_search_results,
-                    errback=self.handle_error,
-                    meta={'dont_redirect': False}
-                )
-            else:
-                yield scrapy.Request(
-                    url=action_url,
-                    callback=self.parse_search_results,
-                    errback=self.handle_error,
-                    meta={'formdata': formdata, 'dont_redirect': False}
-                )
+        # Prefer an advanced search form, otherwise take the first form
+        search_form_xpath = '//form[contains(@action, "search") or contains(@action, "ricerca")]'
+        if not response.xpath(search_form_xpath):
+            search_form_xpath = '//form' if response.xpath('//form') else None
+        
+        # If we found a form, let Scrapy build the submission from it: it
+        # collects inputs, selects and defaults natively and honors the
+        # form's method and action
+        if search_form_xpath:
+            request = FormRequest.from_response(
+                response,
+                formxpath=search_form_xpath,
+                formdata={
+                    'searchType': 'advanced',
+                    'stato': 'A',  # Active companies
+                },
+                callback=self.parse_search_results,
+                errback=self.handle_error,
+                meta={'dont_redirect': False}
+            )
+            logging.info(f"Submitting form to {request.url}")
+            yield request
         else:
             # If no form found, try direct URLs
             fallback_urls = [
@@ -293,44 +483,22 @@ class StartupRegistrySpider(scrapy.Spider):
         if self.debug:
             self.save_response(response, 'search_results')
         
-        # Extract company links more efficiently
-        company_links = []
-        
-        # First try with targeted selectors for higher precision
-        company_selectors = [
-            'a[href*="/company/"]',
-            'a[href*="/startup/"]', 
-            'a[href*="/detail/"]', 
-            'a[href*="/scheda/"]',
-            'a[href*="/impresa/"]',
-            'a[href*="?id="]'
-        ]
-        
-        # Try each selector in order of specificity
-        for selector in company_selectors:
-            links = response.css(selector)
-            if links:
-                for link in links:
-                    href = link.css('::attr(href)').get()
-                    if href:
-                        absolute_url = urljoin(response.url, href)
-                        if absolute_url not in company_links:
-                            company_links.append(absolute_url)
+        # Extract company links, deduplicated in page order (dict keys keep
+        # insertion order, unlike a set)
+        # First try with targeted selectors for higher precision, all in one query
+        join = url_joiner(response.url)
+        company_links = dict.fromkeys(
+            join(href)
+            for href in response.xpath(self.COMPANY_LINKS_XPATH).getall() if href
+        )
         
         # If specific selectors didn't work, try table rows
         if not company_links:
-            # Look for tables with company data
-            table_selectors = ['table.results', 'table.companies', 'table.data', 'table']
-            for table_selector in table_selectors:
-                rows = response.css(f'{table_selector} tr')
-                for row in rows:
-                    links = row.css('a[href]')
-                    for link in links:
-                        href = link.css('::attr(href)').get()
-                        if href and not href.startswith('#'):
-                            absolute_url = urljoin(response.url, href)
-                            if absolute_url not in company_links:
-                                company_links.append(absolute_url)
+            company_links = dict.fromkeys(
+                join(href)
+                for href in response.xpath(self.TABLE_LINKS_XPATH).getall()
+                if href and not href.startswith('#')
+            )
         
         # Process company links with tracking
         for url in company_links:
@@ -339,50 +507,34 @@ class StartupRegistrySpider(scrapy.Spider):
                 url,
                 callback=self.parse_company,
                 errback=self.handle_error,
-                meta={'company_url': url}
+                # Cap how much of a company page is buffered in memory
+                meta={'company_url': url, 'download_maxsize': self.COMPANY_PAGE_MAXSIZE}
             )
         
         # Check for pagination efficiently
         next_page = None
         
-        # Try to find next page link with priority selectors
-        next_selectors = [
-            'a:contains("Next")', 'a:contains("Successivo")',
-            'a:contains("Avanti")', 'a:contains("»")',
-            'a.next', 'a[rel="next"]',
-            'li.next a', 'a[aria-label="Next"]',
-            'a[aria-label="Successivo"]'
-        ]
-        
-        for selector in next_selectors:
-            next_links = response.css(selector)
-            if next_links:
-                href = next_links[0].css('::attr(href)').get()
-                if href:
-                    next_page = urljoin(response.url, href)
-                    break
+        # Try to find an explicit next page link in one pass
+        href = response.xpath(self.NEXT_PAGE_XPATH).get()
+        if href:
+            next_page = urljoin(response.url, href)
         
         # If explicit next page not found, try to find pagination with current page
         if not next_page:
             # Find active page element
-            active_selectors = ['li.active', 'li.selected', 'a.active', 'a.selected', '.pagination .current']
             current_page = None
             
-            for selector in active_selectors:
-                active = response.css(selector)
-                if active:
-                    current_text = active.css('::text').get()
-                    if current_text and current_text.strip().isdigit():
-                        current_page = int(current_text.strip())
-                        
-                        # Look for link to next page
-                        next_page_num = current_page + 1
-                        next_page_links = response.css(f'a:contains("{next_page_num}")')
-                        if next_page_links:
-                            href = next_page_links[0].css('::attr(href)').get()
-                            if href:
-                                next_page = urljoin(response.url, href)
-                                break
+            for xpath in self.ACTIVE_PAGE_XPATHS:
+                current_text = response.xpath(xpath).get()
+                if current_text and current_text.strip().isdigit():
+                    current_page = int(current_text.strip())
+                    
+                    # Look for link to next page
+                    next_page_num = current_page + 1
+                    href = response.xpath(f'(//a[contains(., "{next_page_num}")])[1]/@href').get()
+                    if href:
+                        next_page = urljoin(response.url, href)
+                        break
         
         # Follow next page if found
         if next_page:
@@ -398,105 +550,70 @@ class StartupRegistrySpider(scrapy.Spider):
         company_url = response.meta.get('company_url', response.url)
         logging.info(f"Parsing company page: {company_url}")
         
-        # Calculate company content fingerprint for deduplication
-        content_hash = hashlib.md5(response.body).hexdigest()
+        # Digest the page with markup, whitespace and digits stripped so
+        # the same company served under another URL (or with a different
+        # timestamp) is recognized before any extraction work. This runs on
+        # the raw body, so a duplicate is dropped without ever decoding it
+        normalized = WS_DIGITS_PATTERN.sub(b' ', TAG_PATTERN.sub(b' ', response.body))
+        content_hash = xxhash.xxh3_64_intdigest(normalized)
         
-        # Register fingerprint with dupefilter
+        # Register fingerprint with dupefilter, skipping pages already seen
         dupefilter = self.crawler.engine.slot.scheduler.df
         if hasattr(dupefilter, 'register_company_fingerprint'):
+            if dupefilter.has_company_fingerprint(content_hash):
+                logging.info(f"Skipping duplicate company page: {company_url}")
+                return None
             dupefilter.register_company_fingerprint(content_hash)
         
         if self.debug:
             self.save_response(response, f'company_{self.company_count + 1}')
         
-        # Use ItemLoader for cleaner data extraction
-        loader = StartupLoader(item=StartupItem(), response=response)
-        
-        # 1. Extract company name with priority selectors
-        for selector in self.COMPANY_NAME_SELECTORS:
-            loader.add_css('company_name', f'{selector}::text')
-        
-        # If no name found with CSS, try xpath with text content
-        if not loader.get_collected_values('company_name'):
-            for selector in self.COMPANY_NAME_SELECTORS:
-                loader.add_xpath('company_name', f'//{selector}/text()')
-        
-        # 2. Extract labeled fields using the helper method
-        self.extract_field_with_labels(response, loader, 'creation_date', self.FIELD_LABELS['date'])
-        self.extract_field_with_labels(response, loader, 'region', self.FIELD_LABELS['region'])
-        self.extract_field_with_labels(response, loader, 'city', self.FIELD_LABELS['city'])
-        self.extract_field_with_labels(response, loader, 'phone', self.FIELD_LABELS['phone'])
-        
-        # 3. Try to find creation date with regex if not found with labels
-        if not loader.get_collected_values('creation_date'):
-            for pattern in self.DATE_PATTERNS:
-                matches = pattern.findall(response.text)
-                if matches:
-                    loader.add_value('creation_date', matches[0])
-                    break
+        # Use ItemLoader for cleaner data extraction; hand it the response's
+        # cached selector, otherwise it builds (and parses) a second one
+        loader = StartupLoader(item=StartupItem(), selector=response.selector, response=response)
         
-        # 4. Extract description with priority selectors
-        for selector in self.DESCRIPTION_SELECTORS:
-            loader.add_css('description', f'{selector}::text')
+        # 1. Extract company name from the first priority selector with text
+        for xpath in self.COMPANY_NAME_XPATHS:
+            loader.add_xpath('company_name', xpath)
+            if any(loader.get_collected_values('company_name')):
+                break
         
-        # If no description found, try xpath
-        if not loader.get_collected_values('description'):
-            for selector in self.DESCRIPTION_SELECTORS:
-                loader.add_xpath('description', f'//{selector}/text()')
+        # 2. Extract labeled fields: one automaton scan for all labels,
+        # falling back to the XPath strategies for fields it didn't resolve
+        labeled_values = self.extract_labeled_values(response.selector.root)
+        for field_name, label_key in self.LABELED_FIELDS:
+            if label_key in labeled_values:
+                loader.add_value(field_name, labeled_values[label_key])
+            else:
+                self.extract_field_with_labels(response, loader, field_name, label_key)
         
-        # 5. Extract email
-        # First try mailto links
+        # 3. Extract description from the first priority selector with text
+        for xpath in self.DESCRIPTION_XPATHS:
+            loader.add_xpath('description', xpath)
+            if any(loader.get_collected_values('description')):
+                break
+        
+        # 4. Extract email from mailto links
         email_links = response.css('a[href^="mailto:"]::attr(href)').getall()
         if email_links:
             for link in email_links:
                 loader.add_value('email', link)
                 break
         
-        # If not found, try regex on the page content
-        if not loader.get_collected_values('email'):
-            email_matches = self.EMAIL_PATTERN.findall(response.text)
-            # Filter out common non-company emails
-            filtered_emails = [e for e in email_matches if not any(d in e.lower() for d in ['example.com', 'gmail.com', 'libero.it', 'hotmail'])]
-            if filtered_emails:
-                loader.add_value('email', filtered_emails[0])
-            elif email_matches:
-                loader.add_value('email', email_matches[0])
-        
-        # 6. Extract phone with regex if not found with labels
-        if not loader.get_collected_values('phone'):
-            for pattern in self.PHONE_PATTERNS:
-                matches = pattern.findall(response.text)
-                if matches:
-                    loader.add_value('phone', matches[0])
-                    break
+        # 5. Fill date, email and phone still missing with one regex scan
+        self.extract_fields_with_patterns(response, loader)
         
-        # 7. Look for downloadable files
-        file_urls = []
-        
-        # More specific file selectors
-        file_extensions = ['.pdf', '.doc', '.docx', '.xls', '.xlsx']
-        
-        # First look for links with these extensions
-        for ext in file_extensions:
-            urls = response.css(f'a[href$="{ext}"]::attr(href)').getall()
-            for url in urls:
-                if url:
-                    absolute_url = urljoin(response.url, url)
-                    if absolute_url not in file_urls:
-                        file_urls.append(absolute_url)
-        
-        # Then look for download-related links
-        download_indicators = ['download', 'allegato', 'attachment', 'file', 'documento']
-        for indicator in download_indicators:
-            urls = response.css(f'a[href*="{indicator}"]::attr(href)').getall()
-            for url in urls:
-                if url:
-                    absolute_url = urljoin(response.url, url)
-                    if absolute_url not in file_urls and not any(absolute_url.endswith(ext) for ext in file_extensions):
-                        file_urls.append(absolute_url)
+        # 6. Look for downloadable files
+        file_urls = set()
+        
+        # Links with file extensions or download-related links, in one pass
+        join = url_joiner(response.url)
+        for url in response.xpath(self.FILE_LINKS_XPATH).getall():
+            if url:
+                file_urls.add(join(url))
         
         if file_urls:
-            loader.add_value('file_urls', file_urls)
+            loader.add_value('file_urls', sorted(file_urls))
         
         # Increment company counter
         self.company_count += 1
@@ -504,56 +621,135 @@ class StartupRegistrySpider(scrapy.Spider):
         # Return the loaded item
         return loader.load_item()
     
-    def extract_field_with_labels(self, response, loader, field_name, labels):
-        """Extract content associated with a label using more efficient approach"""
-        # Try all the label options with different selector strategies
-        
-        # First look for label-value pairs in structured data
+    def extract_labeled_values(self, root):
+        """Find every field label in the page's text nodes in one pass and read the value after it"""
+        candidates = {}
+        for node in LABEL_SCAN_TEXT_XPATH(root):
+            text = str(node)
+            # Navigation and other links are never labels ('Contact' menu entries)
+            owner = text_owner(node)
+            if owner is None or IN_LINK_XPATH(owner):
+                continue
+            
+            for end_idx, (label_key, label) in self.LABEL_AUTOMATON.iter(text):
+                if (label_key, label) in candidates:
+                    continue
+                
+                # Whole words only: 'Tel' must not match inside 'Telefono'
+                start_idx = end_idx - len(label) + 1
+                if (start_idx > 0 and text[start_idx - 1].isalnum()) or text[end_idx + 1:end_idx + 2].isalnum():
+                    continue
+                
+                # "Label: value" in the same text node, or an element holding
+                # only the label, whose value is its next sibling element
+                rest = text[end_idx + 1:].strip()
+                if rest.startswith(':') and rest[1:].strip():
+                    value = rest[1:].strip()
+                elif rest in ('', ':') and not text[:start_idx].strip() and not node.is_tail:
+                    value = self.label_sibling_value(owner, text.strip())
+                else:
+                    continue
+                
+                if value and value.rstrip(':').strip() not in self.ALL_LABELS and self.LABEL_VALUE_CHECKS[label_key](value):
+                    candidates[(label_key, label)] = value
+        
+        # Respect label priority within each field
+        values = {}
+        for label_key, labels in self.FIELD_LABELS.items():
+            for label in labels:
+                if (label_key, label) in candidates:
+                    values[label_key] = candidates[(label_key, label)]
+                    break
+        return values
+    
+    def label_sibling_value(self, element, label_text):
+        """Text of the element following a label element, e.g. the cell after <td>Regione</td>"""
+        # The label element must hold only the label, not the value as well
+        if STRING_VALUE_XPATH(element).strip() != label_text:
+            return ''
+        # Climb out of wrappers that hold nothing but the label (<td><b>Regione</b></td>)
+        while element.getnext() is None:
+            parent = element.getparent()
+            if parent is None or STRING_VALUE_XPATH(parent).strip() != label_text:
+                return ''
+            element = parent
+        return WHITESPACE_PATTERN.sub(' ', STRING_VALUE_XPATH(element.getnext())).strip()
+    
+    def extract_field_with_labels(self, response, loader, field_name, label_key):
+        """Extract content associated with a label using one tree walk for all labels"""
+        labels = self.FIELD_LABELS[label_key]
+        text_xpath, dt_xpath = self.FIELD_LABEL_XPATHS[label_key]
+        # Work on the lxml tree directly; parsel would wrap every hit and
+        # every follow-up query result in a new Selector
+        root = response.selector.root
+        
+        # Every element whose own text mentions any of the labels, in one pass
+        hits = [(element, first(OWN_TEXT_XPATH(element), ''))
+                for element in text_xpath(root)]
+        
+        # Labels keep their priority order; strategies are tried per label
         for label in labels:
-            # Method 1: Look for elements containing the label with a colon
-            elements = response.xpath(f'//*[contains(text(), "{label}:")]')
-            for element in elements:
-                full_text = element.css('::text').get() or ''
-                if ':' in full_text:
-                    parts = full_text.split(':', 1)
-                    if len(parts) > 1 and parts[1].strip():
-                        loader.add_value(field_name, parts[1].strip())
+            # Method 1: "Label: value" inside the same text node
+            for element, text in hits:
+                if f'{label}:' in text:
+                    value = text.split(':', 1)[1].strip()
+                    if value:
+                        loader.add_value(field_name, value)
                         return
             
-            # Method 2: Look for elements containing the label followed by a value element
-            elements = response.xpath(f'//*[contains(text(), "{label}")]')
-            for element in elements:
-                # Check next sibling
-                next_text = element.xpath('./following-sibling::*[1]//text()').get()
-                if next_text and next_text.strip():
-                    loader.add_value(field_name, next_text.strip())
-                    return
-                
-                # Check next element in a div or span
-                next_in_container = element.xpath('../*[position()=count(../*[.=current()])+1]//text()').get()
-                if next_in_container and next_in_container.strip():
-                    loader.add_value(field_name, next_in_container.strip())
-                    return
+            # Method 2: label element followed by a value element
+            for element, text in hits:
+                if label in text:
+                    next_text = first(NEXT_SIBLING_TEXT_XPATH(element))
+                    if next_text and next_text.strip():
+                        loader.add_value(field_name, next_text.strip())
+                        return
         
-        # Method 3: Look for table structures with labels
+        # Method 3: table cells with the label followed by the value cell
         for label in labels:
-            # Find table cells containing the label
-            cells = response.xpath(f'//td[contains(text(), "{label}")]')
-            for cell in cells:
-                # Try to get the next cell in the same row
-                next_cell = cell.xpath('./following-sibling::td[1]//text()').get()
-                if next_cell and next_cell.strip():
-                    loader.add_value(field_name, next_cell.strip())
-                    return
-        
-        # Method 4: Try definition lists
+            for element, text in hits:
+                if element.tag == 'td' and label in text:
+                    next_cell = first(NEXT_CELL_TEXT_XPATH(element))
+                    if next_cell and next_cell.strip():
+                        loader.add_value(field_name, next_cell.strip())
+                        return
+        
+        # Method 4: definition lists, matching the label anywhere inside <dt>
+        dts = [(dt, STRING_VALUE_XPATH(dt)) for dt in dt_xpath(root)]
         for label in labels:
-            dt = response.css(f'dt:contains("{label}")')
-            if dt:
-                dd = dt.xpath('./following-sibling::dd[1]//text()').get()
-                if dd and dd.strip():
-                    loader.add_value(field_name, dd.strip())
-                    return
+            for dt, text in dts:
+                if label in text:
+                    dd = first(NEXT_DD_TEXT_XPATH(dt))
+                    if dd and dd.strip():
+                        loader.add_value(field_name, dd.strip())
+                        return
+    
+    def extract_fields_with_patterns(self, response, loader):
+        """Scan the page text once for whichever of date, email and phone are still missing"""
+        missing = {field for field in ('creation_date', 'email', 'phone')
+                   if not any(loader.get_collected_values(field))}
+        if not missing:
+            return
+        
+        fallback_email = None
+        for match in FIELDS_PATTERN.finditer(response.body):
+            field = match.lastgroup
+            if field not in missing:
+                continue
+            value = match.group(field).decode('ascii')
+            
+            # Prefer company emails over common free/placeholder domains
+            if field == 'email' and FREE_EMAIL_PATTERN.search(value):
+                fallback_email = fallback_email or value
+                continue
+            
+            loader.add_value(field, value)
+            missing.discard(field)
+            if not missing:
+                break
+        
+        if 'email' in missing and fallback_email:
+            loader.add_value('email', fallback_email)
     
     def save_response(self, response, name):
         """Save response for debugging only when in debug mode"""
@@ -562,9 +758,20 @@ class StartupRegistrySpider(scrapy.Spider):
             
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = os.path.join('debug', f"{name}_{timestamp}.html")
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(response.text)
-        logging.info(f"Saved debug response to {filename}")
+        # Write the raw body; no need to decode and re-encode the page
+        write_file_in_thread(filename, response.body)
+    
+    def save_error_response(self, response):
+        """Save an error page into a bounded set of rotating files, skipping repeats"""
+        key = (response.status, xxhash.xxh3_64_intdigest(response.body))
+        if key in self.error_ring:
+            return
+        self.error_ring.append(key)
+        
+        slot = self.error_dump_count % self.ERROR_DUMP_SLOTS
+        self.error_dump_count += 1
+        filename = os.path.join('debug', f"error_{response.status}_{slot}.html")
+        write_file_in_thread(filename, response.body)
     
     def handle_error(self, failure):
         """Handle request errors with better logging"""
@@ -575,12 +782,21 @@ class StartupRegistrySpider(scrapy.Spider):
             logging.error(f"Request to {request.url} failed with status {response.status}")
             
             if self.debug:
-                self.save_response(response, f"error_{response.status}")
+                self.save_error_response(response)
         else:
             logging.error(f"Request to {request.url} failed: {failure.value}")
         
+        # Only failures that can turn out differently are retried: a download
+        # cancelled for exceeding download_maxsize, an ignored request or a
+        # client error status would just fail (and be paid for) again
+        if failure.check(HttpError):
+            status = failure.value.response.status
+            retryable = status >= 500 or status in (408, 429)
+        else:
+            retryable = not failure.check(CancelledError, IgnoreRequest)
+        
         # Retry with adjusted parameters if needed
-        if request.meta.get('retry_count', 0) < 2:
+        if retryable and request.meta.get('retry_count', 0) < 2:
             retry_count = request.meta.get('retry_count', 0) + 1
             logging.info(f"Retrying request to {request.url} (attempt {retry_count})")
             
@@ -598,11 +814,12 @@ class ImprovedHeadersMiddleware:
     """Enhanced middleware to add realistic browser headers to requests"""
     
     def process_request(self, request, spider):
-        # Define a set of realistic headers
+        # Define a set of realistic headers; no Cache-Control: max-age=0, since
+        # this runs before HttpCacheMiddleware and RFC2616Policy would then
+        # treat every cached page as stale
         headers = {
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'it-IT,it;q=0.9,en-US;q=0.8,en;q=0.7',
-            'Cache-Control': 'max-age=0',
             'Sec-Ch-Ua': '"Chromium";v="122", "Google Chrome";v="122"',
             'Sec-Ch-Ua-Mobile': '?0',
             'Sec-Ch-Ua-Platform': '"macOS"',
@@ -622,23 +839,34 @@ class ImprovedHeadersMiddleware:
         return None
 
 
+# Item fields written by the export pipelines, in column order
+EXPORT_FIELDS = [
+    'company_name', 'creation_date', 'region',
+    'city', 'description', 'email', 'phone'
+]
+
+
 class StartupExportPipeline:
     """Enhanced pipeline for exporting startup data"""
     
-    def __init__(self):
+    def __init__(self, batch_size=500):
         self.file = None
         self.exporter = None
         self.file_path = 'italian_startups.csv'
+        self.buffer = None
+        self.batch_size = batch_size
+        self.pending = 0
     
     def open_spider(self, spider):
         """Initialize the exporter when the spider starts"""
-        self.file = open(self.file_path, 'wb')
+        # One long-lived handle with a larger buffer keeps writes off the
+        # per-item syscall path
+        self.file = open(self.file_path, 'wb', buffering=1 << 16)
+        # Rows are formatted into memory and written to the file in batches
+        self.buffer = io.BytesIO()
         self.exporter = CsvItemExporter(
-            self.file, 
-            fields_to_export=[
-                'company_name', 'creation_date', 'region', 
-                'city', 'description', 'email', 'phone'
-            ],
+            self.buffer,
+            fields_to_export=EXPORT_FIELDS,
             encoding='utf-8'
         )
         self.exporter.start_exporting()
@@ -648,12 +876,71 @@ class StartupExportPipeline:
         if self.exporter:
             self.exporter.finish_exporting()
         if self.file:
+            self.flush()
             self.file.close()
     
     def process_item(self, item, spider):
         """Process and export each item"""
         self.exporter.export_item(item)
+        self.pending += 1
+        if self.pending >= self.batch_size:
+            self.flush()
         return item
+    
+    def flush(self):
+        """Write the buffered rows to the file in a single call"""
+        self.file.write(self.buffer.getvalue())
+        self.buffer.seek(0)
+        self.buffer.truncate(0)
+        self.pending = 0
+
+
+class StartupParquetPipeline:
+    """Columnar Parquet export of startup data, written alongside the CSV.
+    
+    Optional: enabled by the PARQUET_EXPORT_ENABLED setting (--parquet), and
+    pyarrow is only imported then.
+    """
+    
+    @classmethod
+    def from_crawler(cls, crawler):
+        if not crawler.settings.getbool('PARQUET_EXPORT_ENABLED'):
+            raise NotConfigured('Parquet export disabled (set PARQUET_EXPORT_ENABLED)')
+        return cls()
+    
+    def __init__(self, batch_size=1000):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        self.pa = pa
+        self.pq = pq
+        self.schema = pa.schema([(field, pa.string()) for field in EXPORT_FIELDS])
+        self.writer = None
+        self.file_path = 'italian_startups.parquet'
+        self.batch_size = batch_size
+        self.batch = []
+    
+    def open_spider(self, spider):
+        """Open the Parquet writer when the spider starts"""
+        self.writer = self.pq.ParquetWriter(self.file_path, self.schema)
+    
+    def close_spider(self, spider):
+        """Write the remaining rows and close the file"""
+        if self.writer:
+            self.flush()
+            self.writer.close()
+    
+    def process_item(self, item, spider):
+        """Buffer each item; rows are written one row group per batch"""
+        self.batch.append({field: item.get(field) for field in EXPORT_FIELDS})
+        if len(self.batch) >= self.batch_size:
+            self.flush()
+        return item
+    
+    def flush(self):
+        """Write buffered rows as a single row group"""
+        if self.batch:
+            self.writer.write_table(self.pa.Table.from_pylist(self.batch, schema=self.schema))
+            self.batch = []
 
 
 if __name__ == '__main__':
@@ -663,6 +950,7 @@ if __name__ == '__main__':
     parser = argparse.ArgumentParser(description='Crawl Italian startup registry')
     parser.add_argument('--debug', action='store_true', help='Enable debug mode')
     parser.add_argument('--limit', type=int, default=0, help='Limit number of companies to crawl (0 for no limit)')
+    parser.add_argument('--parquet', action='store_true', help='Also export to Parquet (requires pyarrow)')
     args = parser.parse_args()
     
     # Configure crawler settings
@@ -670,16 +958,20 @@ if __name__ == '__main__':
     settings.update({
         'BOT_NAME': 'startup_registry_crawler',
         'LOG_LEVEL': 'DEBUG' if args.debug else 'INFO',
-        'DOWNLOAD_DELAY': 2,
-        'RANDOMIZE_DOWNLOAD_DELAY': True,
         'USER_AGENT': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36',
         'HTTPERROR_ALLOW_ALL': True,
         'ITEM_PIPELINES': {
             'scrapy.pipelines.files.FilesPipeline': 1,
             '__main__.StartupExportPipeline': 300,
+            '__main__.StartupParquetPipeline': 400,
         },
         'FILES_STORE': 'downloads',
-        'CONCURRENT_REQUESTS': 2,
+        'PARQUET_EXPORT_ENABLED': args.parquet,
+        'CONCURRENT_REQUESTS': 32,
+        'CONCURRENT_REQUESTS_PER_DOMAIN': 16,
+        'SCHEDULER_PRIORITY_QUEUE': 'scrapy.pqueues.DownloaderAwarePriorityQueue',
+        'REACTOR_THREADPOOL_MAXSIZE': 20,
+        'TWISTED_REACTOR': 'twisted.internet.asyncioreactor.AsyncioSelectorReactor',
         'COOKIES_ENABLED': True,
         'RETRY_TIMES': 3,
         'RETRY_HTTP_CODES': [500, 502, 503, 504, 400, 403, 404, 408],
@@ -689,6 +981,9 @@ if __name__ == '__main__':
         'DUPEFILTER_CLASS': '__main__.CacheURLFilter',
         'CLOSESPIDER_ITEMCOUNT': args.limit if args.limit > 0 else 0,
         'AUTOTHROTTLE_ENABLED': True,
+        'AUTOTHROTTLE_START_DELAY': 1.0,
+        'AUTOTHROTTLE_MAX_DELAY': 30.0,
+        'AUTOTHROTTLE_TARGET_CONCURRENCY': 4.0,
     })
     
     # Run the crawler
@@ -2,79 +2,294 @@
 import requests
 import csv
 import time
-import random
-from bs4 import BeautifulSoup
+import os
+import multiprocessing
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import timedelta
+from functools import lru_cache
+from operator import itemgetter
+import lxml.html
+from lxml import etree
+import orjson
+from requests.adapters import HTTPAdapter
+from requests_cache import CachedSession
+from requests_cache.expiration import get_expiration_datetime
+from urllib3.util.retry import Retry
 from urllib.parse import urljoin
 from urllib.robotparser import RobotFileParser
 
+def has_class(name):
+    # XPath equivalent of the CSS class selector .name
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+def first_match(xpaths, tree):
+    # Alternatives are tried in priority order, like select_one(a) or
+    # select_one(b); a union would return the first hit in document order
+    for xpath in xpaths:
+        result = xpath(tree)
+        if result:
+            return result
+    return None
+
+@lru_cache(maxsize=4096)
+def absolute_url(base_url, href):
+    # Listing pages repeat the same hrefs (pagination, companies seen on
+    # earlier pages); absolute links need no urljoin at all
+    if href.startswith(('http://', 'https://')):
+        return href
+    return urljoin(base_url, href)
+
+class RateLimiter:
+    """Token bucket shared by all worker threads."""
+
+    def __init__(self, rate, burst=1):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            # Taking the token up front reserves a slot; a negative balance
+            # is the wait still owed before that slot comes due
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0
+        if wait:
+            time.sleep(wait)
+
+class RateLimitedAdapter(HTTPAdapter):
+    """HTTPAdapter that takes a limiter token before each network send."""
+
+    def __init__(self, limiter, **kwargs):
+        self.limiter = limiter
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        # Responses requests_cache serves from disk never reach the adapter,
+        # so only real network traffic (including revalidation) is throttled
+        self.limiter.acquire()
+        return super().send(request, **kwargs)
+
 class StartupRegistryCrawler:
-    def __init__(self, base_url, output_file, delay_range=(2, 5)):
+    FIELDNAMES = [
+        'Company Name', 'Description', 'Website', 'Email',
+        'Phone Number', 'Region', 'City', 'Date of Establishment', 'URL'
+    ]
+    # Pulls a row's values out in column order in one C call
+    ROW_VALUES = itemgetter(*FIELDNAMES)
+    WRITE_BATCH_SIZE = 100
+    MAX_PAGE_BYTES = 5_000_000
+    ROBOTS_TTL = 24 * 3600
+    CACHE_EXPIRE_AFTER = timedelta(days=7)
+
+    # XPath expressions compiled once and evaluated by libxml2; each field
+    # has its alternatives in priority order for first_match. The
+    # string((...)[1]) forms return an alternative's first match and
+    # normalize-space() also trims and collapses whitespace in the text fields
+    COMPANY_LINK_XPATHS = (
+        etree.XPath(f"//*[{has_class('company-item')}]//a/@href"),
+        etree.XPath(f"//*[{has_class('startup-list')}]//*[{has_class('item')}]//a/@href"),
+    )
+    NEXT_PAGE_XPATHS = (
+        etree.XPath(f"string((//*[{has_class('pagination')}]//*[{has_class('next')}]//a)[1]/@href)"),
+        etree.XPath(f"string((//a[{has_class('next-page')}])[1]/@href)"),
+    )
+    MAILTO_XPATH = etree.XPath("string((//a[starts-with(@href, 'mailto:')])[1]/@href)")
+    WEBSITE_XPATHS = (
+        etree.XPath(f"string((//*[{has_class('website')}]//a)[1]/@href)"),
+        etree.XPath(f"string((//*[{has_class('contact')}]//a[starts-with(@href, 'http')])[1]/@href)"),
+    )
+    TEXT_FIELD_XPATHS = (
+        ('Company Name', (
+            etree.XPath(f"normalize-space((//*[{has_class('company-name')}])[1])"),
+            etree.XPath(f"normalize-space((//h1[{has_class('name')}])[1])"),
+        )),
+        ('Description', (
+            etree.XPath(f"normalize-space((//*[{has_class('company-description')}])[1])"),
+            etree.XPath(f"normalize-space((//*[{has_class('description')}])[1])"),
+        )),
+        ('Phone Number', (
+            etree.XPath(f"normalize-space((//*[{has_class('phone')}])[1])"),
+            etree.XPath(f"normalize-space((//*[{has_class('contact')}]//*[{has_class('tel')}])[1])"),
+        )),
+        ('Region', (
+            etree.XPath(f"normalize-space((//*[{has_class('region')}])[1])"),
+            etree.XPath(f"normalize-space((//*[{has_class('location')}]//*[{has_class('region')}])[1])"),
+        )),
+        ('City', (
+            etree.XPath(f"normalize-space((//*[{has_class('city')}])[1])"),
+            etree.XPath(f"normalize-space((//*[{has_class('location')}]//*[{has_class('city')}])[1])"),
+        )),
+        ('Date of Establishment', (
+            etree.XPath(f"normalize-space((//*[{has_class('establishment-date')}])[1])"),
+            etree.XPath(f"normalize-space((//*[{has_class('founded-date')}])[1])"),
+        )),
+    )
+
+    def __init__(self, base_url, output_file, requests_per_second=2.0, workers=10, parse_processes=None):
         self.base_url = base_url
         self.output_file = output_file
-        self.delay_range = delay_range
-        self.session = requests.Session()
+        self.limiter = RateLimiter(requests_per_second)
+        self.workers = workers
+        # Fetching is throttled to a few pages a second, which a couple of
+        # parse processes keep up with; each spawned one re-imports lxml
+        self.parse_processes = parse_processes or min(2, os.cpu_count() or 1)
+        # Responses are cached on disk so a re-run skips the network for
+        # pages fetched in the last week; only pages that pass
+        # is_cacheable are stored, since storing reads the whole body
+        self.session = CachedSession(
+            'crawler_cache', backend='sqlite', expire_after=self.CACHE_EXPIRE_AFTER, filter_fn=self.is_cacheable
+        )
+        self.processed_urls = set()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
-        self.robot_parser = RobotFileParser()
-        self.robot_parser.set_url(urljoin(base_url, '/robots.txt'))
+        # The default pool keeps 10 connections per host, fewer than the
+        # workers may want; size it to the pool so keep-alive is reused
+        pool_size = max(workers, 50)
+        adapter = RateLimitedAdapter(
+            self.limiter,
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=Retry(total=5, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.robots_url = urljoin(base_url, '/robots.txt')
+        self.robot_parser = None
+        self.robots_lock = threading.Lock()
+        self.read_robots()
+
+    @staticmethod
+    def content_length(response):
+        # Declared body size, or None when the header is missing or malformed
+        # (e.g. "123, 123"); the read cap in get_page covers those
+        content_length = response.headers.get('Content-Length', '').strip()
+        return int(content_length) if content_length.isdigit() else None
+
+    @classmethod
+    def is_cacheable(cls, response):
+        # Decided from the headers alone: HTML with a declared length within
+        # MAX_PAGE_BYTES. Anything else is left to get_page's checks, which
+        # stop reading a streamed body as soon as it fails one; HTML without a
+        # usable length is stored afterwards by cache_page if it fits
+        content_type = response.headers.get('Content-Type', 'text/html')
+        content_length = cls.content_length(response)
+        return 'html' in content_type and content_length is not None and content_length <= cls.MAX_PAGE_BYTES
+
+    def cache_page(self, response, body):
+        # Store a page is_cacheable had to turn away for lack of a usable
+        # Content-Length, now that its body is read and known to fit the cap
         try:
-            self.robot_parser.read()
+            response._content = bytes(body)
+            self.session.cache.save_response(response, expires=get_expiration_datetime(self.CACHE_EXPIRE_AFTER))
+        except Exception as e:
+            print(f"Error caching {response.url}: {e}")
+
+    def read_robots(self):
+        # Parse into a fresh RobotFileParser and swap it in: re-reading into
+        # the same one keeps its first rules and disallow_all/allow_all flags
+        robot_parser = RobotFileParser(self.robots_url)
+        try:
+            robot_parser.read()
         except Exception as e:
             print(f"Error reading robots.txt: {e}")
+            # A failed refresh keeps the rules read last time
+            if self.robot_parser is not None:
+                robot_parser = self.robot_parser
+        self.robot_parser = robot_parser
+        self.robots_read_at = time.monotonic()
 
     def can_fetch(self, url):
+        # Re-read robots.txt once it is older than ROBOTS_TTL; the first
+        # thread to notice refreshes it, the rest keep using the parsed copy
+        if time.monotonic() - self.robots_read_at > self.ROBOTS_TTL:
+            with self.robots_lock:
+                if time.monotonic() - self.robots_read_at > self.ROBOTS_TTL:
+                    self.read_robots()
         try:
             return self.robot_parser.can_fetch('*', url)
         except Exception:
             return True
 
-    def random_delay(self):
-        delay = random.uniform(*self.delay_range)
-        time.sleep(delay)
-
     def get_page(self, url):
         if not self.can_fetch(url):
             print(f"Crawling disallowed for: {url}")
             return None
         
         try:
-            self.random_delay()
-            response = self.session.get(url, timeout=30)
-            if response.status_code == 200:
-                return response.text
-            else:
-                print(f"Failed to get {url}: Status code {response.status_code}")
-                return None
+            # Stream so the headers can be checked before the body is read
+            with self.session.get(url, timeout=30, stream=True) as response:
+                if response.status_code != 200:
+                    print(f"Failed to get {url}: Status code {response.status_code}")
+                    return None
+                content_type = response.headers.get('Content-Type', 'text/html')
+                if 'html' not in content_type:
+                    print(f"Skipping {url}: not HTML ({content_type})")
+                    return None
+                if (self.content_length(response) or 0) > self.MAX_PAGE_BYTES:
+                    print(f"Skipping {url}: larger than {self.MAX_PAGE_BYTES} bytes")
+                    return None
+                # Chunked responses carry no Content-Length, so enforce the
+                # cap while reading too
+                body = bytearray()
+                for chunk in response.iter_content(chunk_size=1 << 16):
+                    body += chunk
+                    if len(body) > self.MAX_PAGE_BYTES:
+                        print(f"Skipping {url}: larger than {self.MAX_PAGE_BYTES} bytes")
+                        return None
+                if not getattr(response, 'from_cache', False) and self.content_length(response) is None:
+                    self.cache_page(response, body)
+                # Raw bytes plus the charset from the Content-Type header, if it
+                # names one; without it lxml falls back to the page's <meta>
+                encoding = response.encoding if 'charset' in content_type.lower() else None
+                return bytes(body), encoding
         except requests.RequestException as e:
             print(f"Request error for {url}: {e}")
             return None
 
-    def parse_company_list_page(self, html):
-        if not html:
-            return []
-            
-        soup = BeautifulSoup(html, 'html.parser')
+    @classmethod
+    def parse_html(cls, html, encoding=None):
+        try:
+            # lxml ignores the HTTP header, so a charset from it is passed explicitly
+            parser = lxml.html.HTMLParser(encoding=encoding) if encoding else None
+        except LookupError:
+            # Unknown or bogus charset in the header; let lxml detect it instead
+            print(f"Ignoring unknown charset: {encoding}")
+            parser = None
+        try:
+            return lxml.html.fromstring(html, parser=parser)
+        except (etree.ParserError, ValueError) as e:
+            print(f"Error parsing HTML: {e}")
+            return None
+
+    def parse_company_list_page(self, tree):
         company_links = []
 
         try:
             # This is a placeholder selector - you'll need to inspect the actual HTML to find the correct selector
-            company_elements = soup.select('.company-item a') or soup.select('.startup-list .item a')
-            
-            for element in company_elements:
-                link = element.get('href')
-                if link:
-                    company_links.append(urljoin(self.base_url, link))
+            base_url = self.base_url
+            # dict.fromkeys drops companies linked more than once while keeping order
+            company_links = list(dict.fromkeys(absolute_url(base_url, str(link)) for link in first_match(self.COMPANY_LINK_XPATHS, tree) or () if link))
         except Exception as e:
             print(f"Error parsing company list: {e}")
         
         return company_links
 
-    def extract_company_data(self, html, url):
+    @classmethod
+    def extract_company_data(cls, html, url, encoding=None):
         if not html:
             return None
             
-        soup = BeautifulSoup(html, 'html.parser')
+        tree = cls.parse_html(html, encoding)
+        if tree is None:
+            return None
         company_data = {
             'Company Name': '',
             'Description': '',
@@ -88,119 +303,161 @@ class StartupRegistryCrawler:
         }
         
         try:
-            # Company Name
-            name_element = soup.select_one('.company-name') or soup.select_one('h1.name')
-            if name_element:
-                company_data['Company Name'] = name_element.text.strip()
-                
-            # Description
-            desc_element = soup.select_one('.company-description') or soup.select_one('.description')
-            if desc_element:
-                company_data['Description'] = desc_element.text.strip()
+            # Name, description, phone, region, city and date of establishment
+            for field, xpaths in cls.TEXT_FIELD_XPATHS:
+                company_data[field] = first_match(xpaths, tree) or ''
                 
             # Website - look for links or specific fields
-            website_element = soup.select_one('.website a') or soup.select_one('.contact a[href^="http"]')
-            if website_element:
-                company_data['Website'] = website_element.get('href', '').strip()
+            company_data['Website'] = (first_match(cls.WEBSITE_XPATHS, tree) or '').strip()
                 
             # Email - look for email links or text
-            email_elements = soup.select('a[href^="mailto:"]')
-            if email_elements:
-                email = email_elements[0].get('href', '').replace('mailto:', '').strip()
-                company_data['Email'] = email
-                
-            # Phone Number
-            phone_element = soup.select_one('.phone') or soup.select_one('.contact .tel')
-            if phone_element:
-                company_data['Phone Number'] = phone_element.text.strip()
-                
-            # Region
-            region_element = soup.select_one('.region') or soup.select_one('.location .region')
-            if region_element:
-                company_data['Region'] = region_element.text.strip()
-                
-            # City
-            city_element = soup.select_one('.city') or soup.select_one('.location .city')
-            if city_element:
-                company_data['City'] = city_element.text.strip()
-                
-            # Date of Establishment
-            date_element = soup.select_one('.establishment-date') or soup.select_one('.founded-date')
-            if date_element:
-                company_data['Date of Establishment'] = date_element.text.strip()
+            company_data['Email'] = cls.MAILTO_XPATH(tree).replace('mailto:', '').strip()
 
         except Exception as e:
             print(f"Error extracting company data from {url}: {e}")
             
         return company_data
 
-    def get_next_page_url(self, html):
-        if not html:
-            return None
-            
-        soup = BeautifulSoup(html, 'html.parser')
-        
+    def get_next_page_url(self, tree):
         try:
             # Look for a next page link - adjust selector based on actual website
-            next_page = soup.select_one('.pagination .next a') or soup.select_one('a.next-page')
-            if next_page and next_page.get('href'):
-                return urljoin(self.base_url, next_page.get('href'))
+            next_page = first_match(self.NEXT_PAGE_XPATHS, tree)
+            if next_page:
+                return absolute_url(self.base_url, str(next_page))
         except Exception as e:
             print(f"Error finding next page: {e}")
             
         return None
 
-    def save_to_csv(self, data):
+    def read_saved_urls(self):
+        if self.jsonl:
+            with open(self.output_file, 'rb') as file:
+                rows = [orjson.loads(line) for line in file if line.strip()]
+        else:
+            with open(self.output_file, newline='', encoding='utf-8') as file:
+                rows = list(csv.DictReader(file))
+        return {row['URL'] for row in rows if row.get('URL')}
+
+    def open_output(self):
+        # A .jsonl output file is written with orjson, anything else as CSV
+        self.jsonl = self.output_file.endswith('.jsonl')
+
+        # Resume an earlier run: remember the companies already written and append
+        resume = os.path.exists(self.output_file) and os.path.getsize(self.output_file) > 0
+        if resume:
+            self.processed_urls.update(self.read_saved_urls())
+            print(f"Resuming: {len(self.processed_urls)} companies already saved")
+
+        # One buffered handle for the whole crawl instead of a rewrite at the end
+        if self.jsonl:
+            self.output = open(self.output_file, 'ab' if resume else 'wb', buffering=1 << 20)
+            return
+        self.output = open(self.output_file, 'a' if resume else 'w', newline='', encoding='utf-8', buffering=1 << 16)
+        self.csv_writer = csv.writer(self.output)
+        if not resume:
+            self.csv_writer.writerow(self.FIELDNAMES)
+
+    def save_rows(self, data):
         if not data:
-            print("No data to save")
             return
             
         try:
-            with open(self.output_file, 'w', newline='', encoding='utf-8') as file:
-                fieldnames = [
-                    'Company Name', 'Description', 'Website', 'Email', 
-                    'Phone Number', 'Region', 'City', 'Date of Establishment', 'URL'
-                ]
-                writer = csv.DictWriter(file, fieldnames=fieldnames)
-                writer.writeheader()
-                for company in data:
-                    writer.writerow(company)
-            print(f"Data saved to {self.output_file}")
+            if self.jsonl:
+                self.output.write(b''.join(orjson.dumps(row) + b'\n' for row in data))
+            else:
+                self.csv_writer.writerows(map(self.ROW_VALUES, data))
         except Exception as e:
-            print(f"Error saving to CSV: {e}")
+            print(f"Error saving to {self.output_file}: {e}")
 
-    def crawl(self, max_pages=10, companies_per_page=None):
+    def close_output(self):
+        self.output.close()
+        print(f"Data saved to {self.output_file}")
+
+    def process_company(self, link):
+        print(f"Processing company: {link}")
+        page = self.get_page(link)
+        if not page:
+            return None
+        company_html, encoding = page
+        # Parsing is CPU-bound, so hand it to a process outside the GIL while
+        # this thread only waits on the result
+        return self.parse_pool.submit(parse_company_page, company_html, link, encoding).result()
+
+    def iter_company_links(self, max_pages=10, companies_per_page=None):
         current_url = self.base_url
         current_page = 1
-        all_companies_data = []
         
         while current_url and current_page <= max_pages:
             print(f"Crawling page {current_page}: {current_url}")
             
-            html = self.get_page(current_url)
-            if not html:
+            page = self.get_page(current_url)
+            if not page:
+                break
+            # Parse the listing once for both the company links and the next page
+            tree = self.parse_html(*page)
+            if tree is None:
                 break
                 
-            company_links = self.parse_company_list_page(html)
+            company_links = self.parse_company_list_page(tree)
             print(f"Found {len(company_links)} company links on page {current_page}")
             
             # Limit companies per page if specified
             if companies_per_page:
                 company_links = company_links[:companies_per_page]
             
-            for link in company_links:
-                print(f"Processing company: {link}")
-                company_html = self.get_page(link)
-                company_data = self.extract_company_data(company_html, link)
-                if company_data:
-                    all_companies_data.append(company_data)
-            
-            # Get next page URL
-            current_url = self.get_next_page_url(html)
+            # Resolve the next page before yielding so the listing tree is
+            # released while its companies are being fetched
+            current_url = self.get_next_page_url(tree)
             current_page += 1
+            page = tree = None
+            
+            # processed_urls also records what was queued, so a company listed
+            # on several pages is only fetched once
+            company_links = [link for link in company_links if link not in self.processed_urls]
+            self.processed_urls.update(company_links)
+            yield from company_links
+
+    def collect_result(self, future, rows):
+        company_data = future.result()
+        if not company_data:
+            return 0
+        rows.append(company_data)
+        if len(rows) >= self.WRITE_BATCH_SIZE:
+            self.save_rows(rows)
+            rows.clear()
+        return 1
+
+    def crawl(self, max_pages=10, companies_per_page=None):
+        companies_saved = 0
+        pending = deque()
+        rows = []
         
-        print(f"Crawling completed. Collected data for {len(all_companies_data)} companies.")
-        self.save_to_csv(all_companies_data)
+        self.open_output()
+        try:
+            # Company pages are network-bound, so fetch them on a thread pool;
+            # the shared limiter keeps the overall request rate polite
+            # Spawned rather than forked: the parse processes start from the
+            # fetch threads, and forking a threaded process is unsafe
+            parse_context = multiprocessing.get_context('spawn')
+            with ProcessPoolExecutor(max_workers=self.parse_processes, mp_context=parse_context) as self.parse_pool, \
+                    ThreadPoolExecutor(max_workers=self.workers) as pool:
+                for link in self.iter_company_links(max_pages, companies_per_page):
+                    pending.append(pool.submit(self.process_company, link))
+                    # Keep at most two queued jobs per worker so memory stays
+                    # bounded however many companies the listing yields
+                    if len(pending) >= 2 * self.workers:
+                        companies_saved += self.collect_result(pending.popleft(), rows)
+                while pending:
+                    companies_saved += self.collect_result(pending.popleft(), rows)
+        finally:
+            self.save_rows(rows)
+            self.close_output()
+        
+        print(f"Crawling completed. Collected data for {companies_saved} companies.")
+
+def parse_company_page(html, url, encoding=None):
+    # Module-level so the process pool can pickle it by name
+    return StartupRegistryCrawler.extract_company_data(html, url, encoding)
 
 
 def main():
@@ -5,16 +5,19 @@ import time
 import random
 import logging
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from webdriver_manager.chrome import ChromeDriverManager
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin
+import lxml.html
+from lxml import etree
 
 # Set up logging
 logging.basicConfig(
@@ -27,16 +30,198 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Patterns compiled once at import instead of on every link or page
+COMPANY_URL_PATTERN = re.compile(r"/(startup|company|profile|detail)/")
+# Social media and registry links that are never a company's own website
+EXCLUDED_WEBSITE_PATTERN = re.compile(r"facebook\.com|twitter\.com|linkedin\.com|instagram\.com|registroimprese\.it")
+EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+
+# Element right after the one whose text contains $label, matched case-insensitively
+LABEL_VALUE_XPATH = etree.XPath(
+    "//*[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), $label)]"
+    "/following-sibling::*[1]"
+)
+
+
+@lru_cache(maxsize=None)
+def chromedriver_path():
+    """chromedriver binary from $CHROMEDRIVER, or resolved by webdriver-manager once per process."""
+    return os.environ.get("CHROMEDRIVER") or ChromeDriverManager().install()
+
+
 class StartupRegistryCrawler:
-    def __init__(self, base_url, output_file, headless=True, delay_range=(1, 3)):
+    FIELDNAMES = [
+        "Company Name", "Description", "Website", "Email", "Phone Number",
+        "Region", "City", "Date of Establishment", "URL"
+    ]
+
+    # Scrolls to the bottom inside the browser until the page height has not
+    # changed for arguments[0] ms, then hands the final height back to Selenium
+    SCROLL_SCRIPT = """
+        const quietMs = arguments[0];
+        const done = arguments[arguments.length - 1];
+        let lastHeight = -1;
+        let stableSince = performance.now();
+        (function step() {
+            const height = document.body.scrollHeight;
+            window.scrollTo(0, height);
+            if (height !== lastHeight) {
+                lastHeight = height;
+                stableSince = performance.now();
+            }
+            if (performance.now() - stableSince >= quietMs) {
+                done(height);
+            } else {
+                setTimeout(step, 50);
+            }
+        })();
+    """
+    SCROLL_QUIET_MS = 500
+
+    # Company pages are read once their heading is rendered, instead of
+    # after a fixed sleep; a page without one is read after the timeout
+    COMPANY_READY_SELECTOR = "h1, .company-name"
+    COMPANY_READY_TIMEOUT = 5
+
+    # (field, label, methods) for extract_text_by_methods; methods are tried in order
+    FIELD_METHODS = (
+        # Company Name methods
+        ("Company Name", "Company Name", (
+            {"type": "css", "selector": "h1"},
+            {"type": "css", "selector": ".company-name"},
+            {"type": "css", "selector": ".startup-name"},
+            {"type": "css", "selector": ".profile-header h1"},
+            {"type": "xpath", "selector": "//h1"},
+            {"type": "xpath", "selector": "//div[contains(@class, 'title')]"},
+        )),
+        # Description methods
+        ("Description", "Description", (
+            {"type": "css", "selector": ".description"},
+            {"type": "css", "selector": ".company-description"},
+            {"type": "css", "selector": ".about"},
+            {"type": "css", "selector": "p.description"},
+            {"type": "xpath", "selector": "//div[contains(@class, 'description')]"},
+            {"type": "xpath", "selector": "//section[contains(@class, 'about')]//p"},
+        )),
+        # Website methods
+        ("Website", "Website", (
+            {"type": "css", "selector": "a[href^='http']", "attribute": "href"},
+            {"type": "css", "selector": ".website a", "attribute": "href"},
+            {"type": "css", "selector": ".url a", "attribute": "href"},
+            {"type": "xpath", "selector": "//a[contains(@href, 'http')]", "attribute": "href"},
+            {"type": "xpath", "selector": "//label[contains(text(), 'Website')]/following-sibling::*//a", "attribute": "href"},
+        )),
+        # Email methods - both visible text and mailto links
+        ("Email", "Email", (
+            {"type": "css", "selector": "a[href^='mailto:']", "attribute": "href"},
+            {"type": "css", "selector": ".email"},
+            {"type": "css", "selector": ".contact-email"},
+            {"type": "xpath", "selector": "//a[contains(@href, 'mailto:')]", "attribute": "href"},
+            {"type": "xpath", "selector": "//label[contains(text(), 'Email')]/following-sibling::*"},
+        )),
+        # Phone Number methods
+        ("Phone Number", "Phone", (
+            {"type": "css", "selector": ".phone"},
+            {"type": "css", "selector": ".tel"},
+            {"type": "css", "selector": ".contact-phone"},
+            {"type": "xpath", "selector": "//label[contains(text(), 'Phone')]/following-sibling::*"},
+            {"type": "xpath", "selector": "//div[contains(text(), 'Phone') or contains(text(), 'Tel')]/following-sibling::*"},
+        )),
+        # Region methods
+        ("Region", "Region", (
+            {"type": "css", "selector": ".region"},
+            {"type": "css", "selector": ".location .region"},
+            {"type": "xpath", "selector": "//label[contains(text(), 'Region')]/following-sibling::*"},
+        )),
+        # City methods
+        ("City", "City", (
+            {"type": "css", "selector": ".city"},
+            {"type": "css", "selector": ".location .city"},
+            {"type": "xpath", "selector": "//label[contains(text(), 'City')]/following-sibling::*"},
+        )),
+        # Date of Establishment methods
+        ("Date of Establishment", "Establishment Date", (
+            {"type": "css", "selector": ".establishment-date"},
+            {"type": "css", "selector": ".founded-date"},
+            {"type": "css", "selector": ".foundation-date"},
+            {"type": "xpath", "selector": "//label[contains(text(), 'Established') or contains(text(), 'Founded')]/following-sibling::*"},
+        )),
+    )
+
+    # Subresources the extraction never reads; blocked through CDP at the network layer
+    BLOCKED_URL_PATTERNS = [
+        "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+        "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+        "*.mp4", "*.webm", "*.mp3",
+    ]
+
+    # Runs every field's selector methods inside the page and returns
+    # {field: first non-empty value}; arguments[0] is [[field, methods], ...]
+    EXTRACT_SCRIPT = """
+        const result = {};
+        for (const [field, methods] of arguments[0]) {
+            result[field] = "";
+            search:
+            for (const method of methods) {
+                let elements;
+                try {
+                    if (method.type === "css") {
+                        elements = document.querySelectorAll(method.selector);
+                    } else if (method.type === "xpath") {
+                        const snapshot = document.evaluate(
+                            method.selector, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+                        elements = Array.from({length: snapshot.snapshotLength}, (_, i) => snapshot.snapshotItem(i));
+                    } else {
+                        continue;
+                    }
+                } catch (e) {
+                    continue;
+                }
+                for (const element of elements) {
+                    let value;
+                    if (method.attribute) {
+                        value = element[method.attribute] ?? element.getAttribute(method.attribute);
+                    } else {
+                        // Like WebElement.text: only rendered elements have visible text
+                        value = element.getClientRects().length ? element.innerText : "";
+                    }
+                    value = value == null ? "" : String(value).trim();
+                    if (value) {
+                        result[field] = value;
+                        break search;
+                    }
+                }
+            }
+        }
+        return result;
+    """
+
+    def __init__(self, base_url, output_file, headless=True, delay_range=(1, 3), workers=1):
         self.base_url = base_url
         self.output_file = output_file
         self.delay_range = delay_range
-        self.setup_driver(headless)
+        self.headless = headless
+        self.workers = workers
+        self.processed_urls = set()
+        
+        # One browser per thread, started on first use: the main thread walks
+        # the listing pages and, with workers > 1, each worker thread loads
+        # company pages in its own; a single worker shares the main browser
+        self._local = threading.local()
+        self.drivers = []
+        self.drivers_lock = threading.Lock()
         
         # Create output directory if it doesn't exist
         os.makedirs(os.path.dirname(output_file) if os.path.dirname(output_file) else '.', exist_ok=True)
 
+    @property
+    def driver(self):
+        """WebDriver owned by the calling thread, started on first use."""
+        driver = getattr(self._local, "driver", None)
+        if driver is None:
+            driver = self._local.driver = self.setup_driver(self.headless)
+        return driver
+
     def setup_driver(self, headless):
         """Set up the Selenium WebDriver with appropriate options."""
         chrome_options = Options()
@@ -51,13 +236,26 @@ class StartupRegistryCrawler:
         chrome_options.add_argument("--no-sandbox")
         chrome_options.add_argument("--disable-dev-shm-usage")
         
+        # Return from driver.get once the DOM is parsed instead of waiting for every subresource
+        chrome_options.page_load_strategy = "eager"
+        
+        # Don't download images; only text and links are extracted
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        chrome_options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+        
         # Add a user agent to appear more like a normal browser
         chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/98.0.4758.102 Safari/537.36")
         
         try:
-            self.driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=chrome_options)
-            self.driver.set_page_load_timeout(30)
+            driver = webdriver.Chrome(service=Service(chromedriver_path()), options=chrome_options)
+            driver.set_page_load_timeout(30)
+            driver.set_script_timeout(30)
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.BLOCKED_URL_PATTERNS})
+            with self.drivers_lock:
+                self.drivers.append(driver)
             logger.info("WebDriver set up successfully")
+            return driver
         except Exception as e:
             logger.error(f"Failed to set up WebDriver: {e}")
             raise
@@ -67,21 +265,36 @@ class StartupRegistryCrawler:
         delay = random.uniform(*self.delay_range)
         time.sleep(delay)
 
-    def get_page(self, url):
-        """Load a page using Selenium and wait for it to be fully rendered."""
+    def get_page(self, url, scroll=True, wait_for=None):
+        """Load a page using Selenium and wait for it to be fully rendered.
+
+        Listing pages are scrolled to trigger lazy loading, since their
+        result lists are where the company links come from. Company pages
+        pass scroll=False and instead wait (wait_for) for the element that
+        shows their content has rendered.
+        """
         try:
             self.random_delay()
+            # With the eager load strategy this returns at DOMContentLoaded
             self.driver.get(url)
             
-            # Wait for the page to load
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
+            # Wait for client-side rendering of the content we are about to read
+            if wait_for:
+                try:
+                    WebDriverWait(self.driver, self.COMPANY_READY_TIMEOUT).until(
+                        EC.presence_of_element_located((By.CSS_SELECTOR, wait_for))
+                    )
+                except TimeoutException:
+                    logger.debug(f"{wait_for} not found on {url}, reading the page as is")
             
             # Scroll down to load any lazy-loaded content
-            self.scroll_page()
+            if scroll:
+                self.scroll_page()
             
-            return self.driver.page_source
+            # Snapshot the rendered HTML once; the fallbacks below reuse it
+            self._local.tree = None
+            self._local.page_source = self.driver.page_source
+            return self._local.page_source
         except TimeoutException:
             logger.error(f"Timeout while loading {url}")
             return None
@@ -89,129 +302,69 @@ class StartupRegistryCrawler:
             logger.error(f"Error loading {url}: {e}")
             return None
 
+    def page_tree(self):
+        """lxml tree of the last loaded page, parsed at most once per page."""
+        tree = getattr(self._local, "tree", None)
+        if tree is None:
+            tree = self._local.tree = lxml.html.fromstring(self._local.page_source)
+        return tree
+
     def scroll_page(self):
         """Scroll down the page to load lazy-loaded content."""
         try:
-            # Get scroll height
-            last_height = self.driver.execute_script("return document.body.scrollHeight")
-            
-            while True:
-                # Scroll down to bottom
-                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                
-                # Wait to load page
-                time.sleep(1)
-                
-                # Calculate new scroll height and compare with last scroll height
-                new_height = self.driver.execute_script("return document.body.scrollHeight")
-                if new_height == last_height:
-                    break
-                last_height = new_height
+            # One round trip: the browser keeps scrolling until the height settles
+            self.driver.execute_async_script(self.SCROLL_SCRIPT, self.SCROLL_QUIET_MS)
         except Exception as e:
             logger.warning(f"Error during page scrolling: {e}")
 
     def find_company_links(self):
-        """Find all company links on the current page using multiple methods."""
-        companies = []
+        """Find all company links on the current page."""
+        companies = {}
         
-        # Method 1: Try to find links by CSS selectors
+        # Collect every resolved href in one round trip and filter them here
         try:
-            # Try multiple possible selectors for startup listings
-            possible_selectors = [
-                ".startup-item a", ".company-item a", ".search-results a", 
-                "a[href*='startup']", "a[href*='company']", "a[href*='profile']",
-                ".card a", ".result-item a", ".list-item a"
-            ]
-            
-            for selector in possible_selectors:
-                elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                if elements:
-                    for element in elements:
-                        href = element.get_attribute("href")
-                        if href and ("/startup/" in href or "/company/" in href or "/profile/" in href):
-                            companies.append(href)
-                    if companies:
-                        break  # Stop if we found companies with this selector
-        
+            hrefs = self.driver.execute_script(
+                "return Array.from(document.querySelectorAll('a[href]'), a => a.href);"
+            )
+            companies = dict.fromkeys(href for href in hrefs if COMPANY_URL_PATTERN.search(href))
         except Exception as e:
-            logger.warning(f"Error finding company links via CSS: {e}")
+            logger.warning(f"Error finding company links: {e}")
         
-        # Method 2: Find all links and filter by URL pattern
-        if not companies:
-            try:
-                all_links = self.driver.find_elements(By.TAG_NAME, "a")
-                for link in all_links:
-                    try:
-                        href = link.get_attribute("href")
-                        if href and re.search(r"/(startup|company|profile|detail)/", href):
-                            companies.append(href)
-                    except StaleElementReferenceException:
-                        continue
-            except Exception as e:
-                logger.warning(f"Error finding company links via general search: {e}")
-        
-        # Method 3: Use BeautifulSoup as backup
-        if not companies:
-            try:
-                soup = BeautifulSoup(self.driver.page_source, "html.parser")
-                for a_tag in soup.find_all("a", href=True):
-                    href = a_tag["href"]
-                    if re.search(r"/(startup|company|profile|detail)/", href):
-                        full_url = urljoin(self.base_url, href)
-                        companies.append(full_url)
-            except Exception as e:
-                logger.warning(f"Error finding company links via BeautifulSoup: {e}")
-        
-        # Remove duplicates and return
-        unique_companies = list(set(companies))
+        # Duplicates are dropped, first occurrence keeps its page order
+        unique_companies = list(companies)
         logger.info(f"Found {len(unique_companies)} unique company links")
         return unique_companies
 
-    def extract_text_by_methods(self, label, methods_list):
-        """Extract text using multiple fallback methods."""
-        for method in methods_list:
-            try:
-                method_type = method["type"]
-                selector = method["selector"]
-                attribute = method.get("attribute", None)
-                
-                if method_type == "css":
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                elif method_type == "xpath":
-                    elements = self.driver.find_elements(By.XPATH, selector)
-                else:
-                    continue
-                
-                for element in elements:
-                    try:
-                        if attribute:
-                            value = element.get_attribute(attribute)
-                        else:
-                            value = element.text
-                        
-                        if value and value.strip():
-                            logger.debug(f"Found {label}: {value[:30]}{'...' if len(value) > 30 else ''}")
-                            return value.strip()
-                    except Exception:
-                        continue
-            except Exception as e:
-                logger.debug(f"Method failed for {label}: {e}")
-                continue
+    def extract_text_by_methods(self, fields):
+        """Extract text for (field, label, methods_list) entries using multiple fallback methods."""
+        # All selector methods for all fields run in the page in one round trip
+        try:
+            values = self.driver.execute_script(
+                self.EXTRACT_SCRIPT, [[field, methods_list] for field, _, methods_list in fields]
+            )
+        except Exception as e:
+            logger.debug(f"In-page extraction failed: {e}")
+            values = {}
+        
+        for field, label, _ in fields:
+            value = values.get(field)
+            if value:
+                logger.debug(f"Found {label}: {value[:30]}{'...' if len(value) > 30 else ''}")
+            else:
+                values[field] = self.extract_text_by_label(label)
         
-        # Try BeautifulSoup as a last resort
+        return values
+
+    def extract_text_by_label(self, label):
+        """Find the value next to a label in the parsed page source."""
         try:
-            soup = BeautifulSoup(self.driver.page_source, "html.parser")
-            
-            # Look for elements containing the label text
-            label_elements = soup.find_all(string=re.compile(label, re.IGNORECASE))
-            for element in label_elements:
-                parent = element.parent
-                if parent and parent.next_sibling:
-                    text = parent.next_sibling.text.strip()
-                    if text:
-                        return text
+            # libxml2 finds every label and its next sibling in one pass
+            for sibling in LABEL_VALUE_XPATH(self.page_tree(), label=label.lower()):
+                text = sibling.text_content().strip()
+                if text:
+                    return text
         except Exception as e:
-            logger.debug(f"BeautifulSoup fallback failed for {label}: {e}")
+            logger.debug(f"lxml fallback failed for {label}: {e}")
         
         return ""
 
@@ -219,13 +372,10 @@ class StartupRegistryCrawler:
         """Extract detailed company information from the company page."""
         logger.info(f"Extracting info from: {url}")
         
-        if not self.get_page(url):
+        if not self.get_page(url, scroll=False, wait_for=self.COMPANY_READY_SELECTOR):
             logger.error(f"Failed to load company page: {url}")
             return None
         
-        # Allow page to fully load
-        time.sleep(2)
-        
         company_data = {
             "Company Name": "",
             "Description": "",
@@ -238,99 +388,35 @@ class StartupRegistryCrawler:
             "URL": url
         }
         
-        # Company Name methods
-        company_name_methods = [
-            {"type": "css", "selector": "h1"},
-            {"type": "css", "selector": ".company-name"},
-            {"type": "css", "selector": ".startup-name"},
-            {"type": "css", "selector": ".profile-header h1"},
-            {"type": "xpath", "selector": "//h1"},
-            {"type": "xpath", "selector": "//div[contains(@class, 'title')]"}
-        ]
-        company_data["Company Name"] = self.extract_text_by_methods("Company Name", company_name_methods)
-        
-        # Description methods
-        description_methods = [
-            {"type": "css", "selector": ".description"},
-            {"type": "css", "selector": ".company-description"},
-            {"type": "css", "selector": ".about"},
-            {"type": "css", "selector": "p.description"},
-            {"type": "xpath", "selector": "//div[contains(@class, 'description')]"},
-            {"type": "xpath", "selector": "//section[contains(@class, 'about')]//p"}
-        ]
-        company_data["Description"] = self.extract_text_by_methods("Description", description_methods)
+        values = self.extract_text_by_methods(self.FIELD_METHODS)
+        company_data["Company Name"] = values["Company Name"]
+        company_data["Description"] = values["Description"]
         
-        # Website methods
-        website_methods = [
-            {"type": "css", "selector": "a[href^='http']", "attribute": "href"},
-            {"type": "css", "selector": ".website a", "attribute": "href"},
-            {"type": "css", "selector": ".url a", "attribute": "href"},
-            {"type": "xpath", "selector": "//a[contains(@href, 'http')]", "attribute": "href"},
-            {"type": "xpath", "selector": "//label[contains(text(), 'Website')]/following-sibling::*//a", "attribute": "href"}
-        ]
-        website = self.extract_text_by_methods("Website", website_methods)
         # Filter out social media and other irrelevant URLs
-        if website and not any(domain in website for domain in ["facebook.com", "twitter.com", "linkedin.com", "instagram.com", "registroimprese.it"]):
+        website = values["Website"]
+        if website and not EXCLUDED_WEBSITE_PATTERN.search(website):
             company_data["Website"] = website
         
-        # Email methods - both visible text and mailto links
-        email_methods = [
-            {"type": "css", "selector": "a[href^='mailto:']", "attribute": "href"},
-            {"type": "css", "selector": ".email"},
-            {"type": "css", "selector": ".contact-email"},
-            {"type": "xpath", "selector": "//a[contains(@href, 'mailto:')]", "attribute": "href"},
-            {"type": "xpath", "selector": "//label[contains(text(), 'Email')]/following-sibling::*"}
-        ]
-        email = self.extract_text_by_methods("Email", email_methods)
+        email = values["Email"]
         if email:
             # Extract email from mailto: link if needed
             email = email.replace("mailto:", "").strip()
             company_data["Email"] = email
         else:
             # Try to find email using regex in page source
-            page_source = self.driver.page_source
-            email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-            emails = re.findall(email_pattern, page_source)
-            if emails:
-                company_data["Email"] = emails[0]
+            match = EMAIL_PATTERN.search(self._local.page_source)
+            if match:
+                company_data["Email"] = match.group()
         
-        # Phone Number methods
-        phone_methods = [
-            {"type": "css", "selector": ".phone"},
-            {"type": "css", "selector": ".tel"},
-            {"type": "css", "selector": ".contact-phone"},
-            {"type": "xpath", "selector": "//label[contains(text(), 'Phone')]/following-sibling::*"},
-            {"type": "xpath", "selector": "//div[contains(text(), 'Phone') or contains(text(), 'Tel')]/following-sibling::*"}
-        ]
-        company_data["Phone Number"] = self.extract_text_by_methods("Phone", phone_methods)
-        
-        # Region methods
-        region_methods = [
-            {"type": "css", "selector": ".region"},
-            {"type": "css", "selector": ".location .region"},
-            {"type": "xpath", "selector": "//label[contains(text(), 'Region')]/following-sibling::*"}
-        ]
-        company_data["Region"] = self.extract_text_by_methods("Region", region_methods)
-        
-        # City methods
-        city_methods = [
-            {"type": "css", "selector": ".city"},
-            {"type": "css", "selector": ".location .city"},
-            {"type": "xpath", "selector": "//label[contains(text(), 'City')]/following-sibling::*"}
-        ]
-        company_data["City"] = self.extract_text_by_methods("City", city_methods)
-        
-        # Date of Establishment methods
-        date_methods = [
-            {"type": "css", "selector": ".establishment-date"},
-            {"type": "css", "selector": ".founded-date"},
-            {"type": "css", "selector": ".foundation-date"},
-            {"type": "xpath", "selector": "//label[contains(text(), 'Established') or contains(text(), 'Founded')]/following-sibling::*"}
-        ]
-        company_data["Date of Establishment"] = self.extract_text_by_methods("Establishment Date", date_methods)
+        company_data["Phone Number"] = values["Phone Number"]
+        company_data["Region"] = values["Region"]
+        company_data["City"] = values["City"]
+        company_data["Date of Establishment"] = values["Date of Establishment"]
         
-        # Last ditch effort - extract all structured data from the page
-        if not any(company_data.values()):
+        # Last ditch effort - fill the fields still missing from the page's
+        # structured label/value pairs; each label costs several WebDriver
+        # round trips, so only for pages where the selectors found little
+        if sum(1 for key, value in company_data.items() if value and key != "URL") < 3:
             try:
                 # Try to extract all label-value pairs on the page
                 labels = self.driver.find_elements(By.CSS_SELECTOR, "label, dt, th")
@@ -373,6 +459,10 @@ class StartupRegistryCrawler:
                             company_data["City"] = value
                         elif any(x in label_text for x in ["found", "estab", "date", "start"]) and not company_data["Date of Establishment"]:
                             company_data["Date of Establishment"] = value
+                        
+                        # Stop walking the labels once every field has a value
+                        if all(company_data.values()):
+                            break
                     except Exception:
                         continue
             except Exception as e:
@@ -444,30 +534,54 @@ class StartupRegistryCrawler:
         
         return next_page_url
 
-    def save_to_csv(self, data):
-        """Save the extracted data to a CSV file."""
-        if not data:
-            logger.warning("No data to save")
-            return False
+    def read_saved_urls(self):
+        """URLs of the companies already written to the CSV file."""
+        with open(self.output_file, newline='', encoding='utf-8') as file:
+            return {row["URL"] for row in csv.DictReader(file) if row.get("URL")}
+
+    def open_output(self):
+        """Open the CSV file and write the header; rows are appended as they are extracted."""
+        # Resume an earlier run: remember the companies already written and append
+        resume = os.path.exists(self.output_file) and os.path.getsize(self.output_file) > 0
+        if resume:
+            self.processed_urls.update(self.read_saved_urls())
+            logger.info(f"Resuming: {len(self.processed_urls)} companies already saved")
         
+        self.output = open(self.output_file, 'a' if resume else 'w', newline='', encoding='utf-8')
+        self.writer = csv.DictWriter(self.output, fieldnames=self.FIELDNAMES)
+        if not resume:
+            self.writer.writeheader()
+
+    def save_company(self, company):
+        """Append one company row to the CSV file."""
         try:
-            with open(self.output_file, 'w', newline='', encoding='utf-8') as file:
-                fieldnames = list(data[0].keys())
-                writer = csv.DictWriter(file, fieldnames=fieldnames)
-                writer.writeheader()
-                for company in data:
-                    writer.writerow(company)
-            logger.info(f"Data saved to {self.output_file}")
-            return True
+            self.writer.writerow(company)
         except Exception as e:
             logger.error(f"Error saving to CSV: {e}")
-            return False
+
+    def close_output(self):
+        """Flush and close the CSV file."""
+        try:
+            self.output.close()
+            logger.info(f"Data saved to {self.output_file}")
+        except Exception as e:
+            logger.error(f"Error closing CSV: {e}")
+
+    def process_company(self, link):
+        """Extract one company page in a worker thread; errors are logged, not raised."""
+        try:
+            return self.extract_company_info(link)
+        except Exception as e:
+            logger.error(f"Error processing company {link}: {e}")
+            return None
 
     def crawl(self, max_pages=5, companies_per_page=None):
         """Main crawling method that orchestrates the process."""
         current_url = self.base_url
         current_page = 1
         all_companies_data = []
+        executor = ThreadPoolExecutor(max_workers=self.workers) if self.workers > 1 else None
+        self.open_output()
         
         try:
             while current_url and current_page <= max_pages:
@@ -486,22 +600,32 @@ class StartupRegistryCrawler:
                 if companies_per_page and len(company_links) > companies_per_page:
                     company_links = company_links[:companies_per_page]
                 
-                # Process each company
-                for link in company_links:
-                    try:
-                        company_data = self.extract_company_info(link)
-                        if company_data and any(value for key, value in company_data.items() if key != "URL"):
-                            all_companies_data.append(company_data)
-                            logger.info(f"Successfully extracted data for: {company_data.get('Company Name', 'Unknown Company')}")
-                        else:
-                            logger.warning(f"No data extracted from {link}")
-                    except Exception as e:
-                        logger.error(f"Error processing company {link}: {e}")
+                # Skip companies saved by an earlier run or already queued from another page
+                company_links = [link for link in company_links if link not in self.processed_urls]
+                self.processed_urls.update(company_links)
                 
-                # Periodically save data in case of crash
-                if current_page % 2 == 0 and all_companies_data:
-                    self.save_to_csv(all_companies_data)
-                    logger.info(f"Intermediate save completed after page {current_page}")
+                # Process the companies in parallel worker browsers, where the
+                # listing page stays loaded in the main driver; a single
+                # worker runs inline on the main browser instead
+                if executor:
+                    results = executor.map(self.process_company, company_links)
+                else:
+                    results = map(self.process_company, company_links)
+                for link, company_data in zip(company_links, results):
+                    if company_data and any(value for key, value in company_data.items() if key != "URL"):
+                        all_companies_data.append(company_data)
+                        self.save_company(company_data)
+                        logger.info(f"Successfully extracted data for: {company_data.get('Company Name', 'Unknown Company')}")
+                    else:
+                        logger.warning(f"No data extracted from {link}")
+                
+                # Push this page's rows to disk in case of crash
+                self.output.flush()
+                
+                # Inline processing navigated away from the listing page
+                if not executor and company_links and not self.get_page(current_url):
+                    logger.error(f"Failed to reload page {current_page}: {current_url}")
+                    break
                 
                 # Find the next page link
                 next_page_url = self.find_next_page_link()
@@ -517,16 +641,18 @@ class StartupRegistryCrawler:
         except Exception as e:
             logger.error(f"Unexpected error during crawling: {e}")
         finally:
-            # Save all collected data
-            if all_companies_data:
-                self.save_to_csv(all_companies_data)
+            if executor:
+                executor.shutdown(wait=True, cancel_futures=True)
             
-            # Close the browser
-            try:
-                self.driver.quit()
-                logger.info("Browser closed successfully")
-            except Exception as e:
-                logger.error(f"Error closing browser: {e}")
+            self.close_output()
+            
+            # Close the browsers
+            for driver in self.drivers:
+                try:
+                    driver.quit()
+                    logger.info("Browser closed successfully")
+                except Exception as e:
+                    logger.error(f"Error closing browser: {e}")
             
             logger.info(f"Crawling completed. Collected data for {len(all_companies_data)} companies.")
             return all_companies_data
@@ -541,7 +667,8 @@ def main():
         base_url=base_url,
         output_file=output_file,
         headless=False,  # Set to False to see the browser for debugging
-        delay_range=(2, 5)  # Random delay between 2-5 seconds between requests
+        delay_range=(2, 5),  # Random delay between 2-5 seconds between requests
+        workers=3  # Browsers loading company pages in parallel; each opens its own window next to the listing browser
     )
     
     # Start crawling - adjust parameters as needed